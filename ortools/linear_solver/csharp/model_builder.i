@@ -41,6 +41,10 @@ VECTOR_AS_CSHARP_ARRAY(double, double, double, DoubleVector);
     options.obfuscate = obfuscate;
     return $self->ExportToLpString(options);
   }
+
+  bool ImportFromMpsString(const std::string& mps_string) {
+    return $self->ImportFromMpsString(mps_string);
+  }
 }  // Extend operations_research::ModelBuilderHelper
 
 %ignoreall
@@ -117,7 +121,7 @@ VECTOR_AS_CSHARP_ARRAY(double, double, double, DoubleVector);
 %rename (Name) operations_research::ModelBuilderHelper::name;
 %unignore operations_research::ModelBuilderHelper::SetName;
 %unignore operations_research::ModelBuilderHelper::WriteModelToFile;
-%unignore operations_research::ModelBuilderHelper::ImportFromMpsString;
+%unignore operations_research::ModelBuilderHelper::ImportFromMpsString(const std::string&);
 %unignore operations_research::ModelBuilderHelper::ImportFromMpsFile;
 %unignore operations_research::ModelBuilderHelper::ImportFromLpString;
 %unignore operations_research::ModelBuilderHelper::ImportFromLpFile;
@@ -99,6 +99,10 @@ class GlobalRefGuard {
     options.obfuscate = obfuscate;
     return $self->ExportToLpString(options);
   }
+
+  bool importFromMpsString(const std::string& mps_string) {
+    return $self->ImportFromMpsString(mps_string);
+  }
 }  // Extend operations_research::ModelBuilderHelper
 
 %ignoreall
@@ -175,7 +179,7 @@ class GlobalRefGuard {
 %rename (getName) operations_research::ModelBuilderHelper::name;
 %rename (setName) operations_research::ModelBuilderHelper::SetName;
 %rename (writeModelToFile) operations_research::ModelBuilderHelper::WriteModelToFile;
-%rename (importFromMpsString) operations_research::ModelBuilderHelper::ImportFromMpsString;
+%unignore operations_research::ModelBuilderHelper::importFromMpsString;
 %rename (importFromMpsFile) operations_research::ModelBuilderHelper::ImportFromMpsFile;
 %rename (importFromLpString) operations_research::ModelBuilderHelper::ImportFromLpString;
 %rename (importFromLpFile) operations_research::ModelBuilderHelper::ImportFromLpFile;
@@ -37,7 +37,7 @@ import dataclasses
 import math
 import numbers
 import typing
-from typing import Callable, List, Optional, Sequence, Tuple, Union, cast
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
 from numpy import typing as npt
@@ -94,6 +94,8 @@ class LinearExpr(metaclass=abc.ABCMeta):
     ```
     """
 
+    __slots__ = ()
+
     @classmethod
     def sum(  # pytype: disable=annotation-type-mismatch  # numpy-scalars
         cls, expressions: Sequence[LinearExprT], *, constant: NumberT = 0.0
@@ -149,6 +151,10 @@ class LinearExpr(metaclass=abc.ABCMeta):
         checked_constant: np.double = mbn.assert_is_a_number(constant)
         if not expressions:
             return checked_constant
+        if all(isinstance(expr, Variable) for expr in expressions):
+            return _variables_as_flat_linear_expression(
+                expressions, coefficients, offset=checked_constant
+            )
         return _sum_as_flat_linear_expression(
             to_process=list(zip(expressions, coefficients)), offset=checked_constant
         )
@@ -176,12 +182,29 @@ class LinearExpr(metaclass=abc.ABCMeta):
         checked_coefficient: np.double = mbn.assert_is_a_number(coefficient)
         checked_constant: np.double = mbn.assert_is_a_number(constant)
 
-        if mbn.is_zero(checked_coefficient):
+        # Both values are np.double here, so the trivial cases are plain float
+        # comparisons and return before any array is allocated.
+        if checked_coefficient == 0.0:
             return checked_constant
-        if mbn.is_one(checked_coefficient) and mbn.is_zero(checked_constant):
+        if checked_coefficient == 1.0 and checked_constant == 0.0:
             return expression
         if mbn.is_a_number(expression):
             return np.double(expression) * checked_coefficient + checked_constant
+        # Flat expressions are scaled with one array operation.
+        if isinstance(expression, Variable):
+            return _LinearExpression(
+                np.array([expression.index], dtype=np.int32),
+                np.array([checked_coefficient], dtype=np.double),
+                checked_constant,
+                expression.helper,
+            )
+        if isinstance(expression, _LinearExpression):
+            return _LinearExpression(
+                expression._variable_indices,
+                expression._coefficients * checked_coefficient,
+                expression._offset * checked_coefficient + checked_constant,
+                expression._helper,
+            )
         if isinstance(expression, LinearExpr):
             return _as_flat_linear_expression(
                 expression * checked_coefficient + checked_constant
@@ -245,6 +268,8 @@ class Variable(LinearExpr):
     model is feasible, or optimal if you provided an objective function.
     """
 
+    __slots__ = ("__helper", "__index")
+
     def __init__(
         self,
         helper: mbh.ModelBuilderHelper,
@@ -292,7 +317,8 @@ class Variable(LinearExpr):
         """Returns true if self == other in the python sense."""
         if not isinstance(other, Variable):
             return False
-        return self.index == other.index and self.helper == other.helper
+        # Indices are np.int32: convert so that __bool__ callers get a bool.
+        return bool(self.index == other.index) and self.helper == other.helper
 
     def __str__(self) -> str:
         return self.name
@@ -374,6 +400,8 @@ class _BoundedLinearExpr(metaclass=abc.ABCMeta):
       * VarEqVar: an equality comparison between two variables.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def _add_linear_constraint(
         self, helper: mbh.ModelBuilderHelper, name: str
@@ -513,7 +541,7 @@ class VarEqVar(_BoundedLinearExpr):
         return self.__str__()
 
     def __bool__(self) -> bool:
-        return hash(self.left) == hash(self.right)
+        return self.left.is_equal_to(self.right)
 
     def _add_linear_constraint(
         self, helper: mbh.ModelBuilderHelper, name: str
@@ -558,6 +586,8 @@ class BoundedLinearExpression(_BoundedLinearExpr):
         model.Add(x + 2 * y -1 >= z)
     """
 
+    __slots__ = ("__expr", "__lb", "__ub")
+
     def __init__(self, expr: LinearExprT, lb: NumberT, ub: NumberT):
         self.__expr: LinearExprT = expr
         self.__lb: np.double = mbn.assert_is_a_number(lb)
@@ -970,8 +1000,8 @@ class Model:
         Returns:
           pd.Series: The lower bounds of all linear constraints in the set.
         """
-        return _attribute_series(
-            func=lambda c: c.lower_bound,  # pylint: disable=protected-access
+        return _indexed_series(
+            func=self.__helper.constraint_lower_bounds,
             values=self._get_linear_constraints(constraints),
         )
 
@@ -992,8 +1022,8 @@ class Model:
         Returns:
           pd.Series: The upper bounds of all linear constraints in the set.
         """
-        return _attribute_series(
-            func=lambda c: c.upper_bound,  # pylint: disable=protected-access
+        return _indexed_series(
+            func=self.__helper.constraint_upper_bounds,
             values=self._get_linear_constraints(constraints),
         )
 
@@ -1022,8 +1052,8 @@ class Model:
         Returns:
           pd.Series: The lower bounds of all variables in the set.
         """
-        return _attribute_series(
-            func=lambda v: v.lower_bound,  # pylint: disable=protected-access
+        return _indexed_series(
+            func=self.__helper.var_lower_bounds,
             values=self._get_variables(variables),
         )
 
@@ -1040,11 +1070,62 @@ class Model:
         Returns:
           pd.Series: The upper bounds of all variables in the set.
         """
-        return _attribute_series(
-            func=lambda v: v.upper_bound,  # pylint: disable=protected-access
+        return _indexed_series(
+            func=self.__helper.var_upper_bounds,
             values=self._get_variables(variables),
         )
 
+    def set_variable_lower_bounds(
+        self,
+        variables: _IndexOrSeries,
+        bounds: Union[NumberT, pd.Series],
+    ) -> None:
+        """Sets the lower bounds of all variables in the set.
+
+        All bounds are updated in a single call to the underlying helper, which
+        makes it cheap to modify a model in place between two solves.
+
+        Args:
+          variables (Union[pd.Index, pd.Series]): Required. The set of variables
+            whose lower bounds will be set.
+          bounds (Union[NumberT, pd.Series]): Required. A number, or a series
+            indexed like `variables` with one lower bound per variable.
+
+        Raises:
+          TypeError: if the type of `bounds` is not recognized.
+          ValueError: if the index of `bounds` does not match `variables`.
+        """
+        self.__helper.set_var_lower_bounds(
+            _index_array(variables),
+            _convert_to_array_and_validate_index(
+                bounds, _get_index(variables), np.double
+            ),
+        )
+
+    def set_variable_upper_bounds(
+        self,
+        variables: _IndexOrSeries,
+        bounds: Union[NumberT, pd.Series],
+    ) -> None:
+        """Sets the upper bounds of all variables in the set.
+
+        Args:
+          variables (Union[pd.Index, pd.Series]): Required. The set of variables
+            whose upper bounds will be set.
+          bounds (Union[NumberT, pd.Series]): Required. A number, or a series
+            indexed like `variables` with one upper bound per variable.
+
+        Raises:
+          TypeError: if the type of `bounds` is not recognized.
+          ValueError: if the index of `bounds` does not match `variables`.
+        """
+        self.__helper.set_var_upper_bounds(
+            _index_array(variables),
+            _convert_to_array_and_validate_index(
+                bounds, _get_index(variables), np.double
+            ),
+        )
+
     # Integer variable.
 
     def new_var(
@@ -1168,21 +1249,20 @@ class Model:
                 + "upper_bound={})={}".format(upper_bounds, math.floor(upper_bounds))
                 + " for variable set={}".format(name)
             )
-        lower_bounds = _convert_to_series_and_validate_index(lower_bounds, index)
-        upper_bounds = _convert_to_series_and_validate_index(upper_bounds, index)
-        is_integrals = _convert_to_series_and_validate_index(is_integral, index)
+        # All variables are created with a single call to the helper.
+        var_indices = self.__helper.add_var_array_with_bounds(
+            _convert_to_array_and_validate_index(lower_bounds, index, np.double),
+            _convert_to_array_and_validate_index(upper_bounds, index, np.double),
+            _convert_to_array_and_validate_index(is_integral, index, bool),
+            "",
+        )
+        for i, var_index in zip(index, var_indices):
+            self.__helper.set_var_name(var_index, f"{name}[{i}]")
         return pd.Series(
             index=index,
             data=[
-                # pylint: disable=g-complex-comprehension
-                Variable(
-                    helper=self.__helper,
-                    name=f"{name}[{i}]",
-                    lb=lower_bounds[i],
-                    ub=upper_bounds[i],
-                    is_integral=is_integrals[i],
-                )
-                for i in index
+                Variable(self.__helper, var_index, None, None, None)
+                for var_index in var_indices
             ],
         )
 
@@ -1349,6 +1429,48 @@ class Model:
         else:
             raise TypeError("Not supported: Model.add(" + str(ct) + ")")
 
+    def add_linear_constraints_from_sparse_data(
+        self,
+        constraint_matrix,
+        lower_bounds: Union[NumberT, npt.ArrayLike] = -math.inf,
+        upper_bounds: Union[NumberT, npt.ArrayLike] = math.inf,
+    ) -> pd.Index:
+        """Adds the constraints `lower_bounds <= constraint_matrix @ x <= upper_bounds`.
+
+        All rows are added in a single call to the underlying helper, which is much
+        faster than calling `add()` once per row for large models.
+
+        Args:
+          constraint_matrix: A 2D matrix (a `scipy.sparse` matrix or a dense
+            array). Row `i` holds the coefficients of the i-th new constraint, and
+            column `j` corresponds to the variable with index `j`. Triplets can be
+            passed directly as a `scipy.sparse.coo_matrix`; duplicate entries are
+            summed.
+          lower_bounds: A number or an array with one lower bound per row. Defaults
+            to -inf.
+          upper_bounds: A number or an array with one upper bound per row. Defaults
+            to +inf.
+
+        Returns:
+          pd.Index: The new linear constraints, in the order of the rows.
+
+        Raises:
+          ValueError: if the bounds cannot be broadcast to the number of rows.
+        """
+        num_rows = constraint_matrix.shape[0]
+        lbs = np.broadcast_to(np.asarray(lower_bounds, dtype=np.double), (num_rows,))
+        ubs = np.broadcast_to(np.asarray(upper_bounds, dtype=np.double), (num_rows,))
+        first_index = self.__helper.add_linear_constraints_from_sparse_data(
+            lbs, ubs, constraint_matrix
+        )
+        return pd.Index(
+            [
+                self.linear_constraint_from_index(i)
+                for i in range(first_index, first_index + num_rows)
+            ],
+            name="linear_constraint",
+        )
+
     def linear_constraint_from_index(self, index: IntegerT) -> LinearConstraint:
         """Rebuilds a linear constraint object from the model and its index."""
         return LinearConstraint(self.__helper, index)
@@ -1536,7 +1658,7 @@ class Model:
         """Exports the optimization model to a ProtoBuf format."""
         return mbh.to_mpmodel_proto(self.__helper)
 
-    def import_from_mps_string(self, mps_string: str) -> bool:
+    def import_from_mps_string(self, mps_string: Union[str, bytes]) -> bool:
         return self.__helper.import_from_mps_string(mps_string)
 
     def import_from_mps_file(self, mps_file: str) -> bool:
@@ -1655,8 +1777,8 @@ class Solver:
         """
         if not self.__solve_helper.has_solution():
             return _attribute_series(func=lambda v: pd.NA, values=variables)
-        return _attribute_series(
-            func=lambda v: self.__solve_helper.var_value(v.index),
+        return _gathered_series(
+            all_values=self.__solve_helper.variable_values(),
             values=variables,
         )
 
@@ -1677,8 +1799,8 @@ class Solver:
         """
         if not self.__solve_helper.has_solution():
             return _attribute_series(func=lambda v: pd.NA, values=variables)
-        return _attribute_series(
-            func=lambda v: self.__solve_helper.reduced_cost(v.index),
+        return _gathered_series(
+            all_values=self.__solve_helper.reduced_costs(),
             values=variables,
         )
 
@@ -1705,8 +1827,8 @@ class Solver:
         """
         if not self.__solve_helper.has_solution():
             return _attribute_series(func=lambda v: pd.NA, values=constraints)
-        return _attribute_series(
-            func=lambda v: self.__solve_helper.dual_value(v.index),
+        return _gathered_series(
+            all_values=self.__solve_helper.dual_values(),
             values=constraints,
         )
 
@@ -1759,22 +1881,46 @@ _MAX_LINEAR_EXPRESSION_REPR_TERMS = 5
 
 @dataclasses.dataclass(repr=False, eq=False, frozen=True)
 class _LinearExpression(LinearExpr):
-    """For variables x, an expression: offset + sum_{i in I} coeff_i * x_i."""
+    """For variables x, an expression: offset + sum_{i in I} coeff_i * x_i.
 
-    __slots__ = ("_variable_indices", "_coefficients", "_offset", "_helper")
+    The terms are stored in coordinate form: `_variable_indices` may be unsorted
+    and contain duplicates. They are only merged when read through the public
+    properties, or by the helper when the expression is added to the model.
+    """
+
+    __slots__ = (
+        "_variable_indices",
+        "_coefficients",
+        "_offset",
+        "_helper",
+        "_merged_terms",
+    )
 
     _variable_indices: npt.NDArray[np.int32]
     _coefficients: npt.NDArray[np.double]
     _offset: float
     _helper: Optional[mbh.ModelBuilderHelper]
 
+    def _coalesce(self) -> Tuple[npt.NDArray[np.int32], npt.NDArray[np.double]]:
+        """Returns the sorted variable indices and their merged coefficients.
+
+        The terms are merged on the first call and cached in `_merged_terms`,
+        which is not a dataclass field.
+        """
+        try:
+            return self._merged_terms
+        except AttributeError:
+            merged_terms = _coalesce_terms(self._variable_indices, self._coefficients)
+            object.__setattr__(self, "_merged_terms", merged_terms)
+            return merged_terms
+
     @property
-    def variable_indices(self) -> npt.NDArray[np.int32]:
-        return self._variable_indices
+    def variable_indices(self) -> List[int]:
+        return self._coalesce()[0].tolist()
 
     @property
-    def coefficients(self) -> npt.NDArray[np.double]:
-        return self._coefficients
+    def coefficients(self) -> List[float]:
+        return self._coalesce()[1].tolist()
 
     @property
     def constant(self) -> float:
@@ -1791,11 +1937,13 @@ class _LinearExpression(LinearExpr):
         if self._helper is None:
             return str(self._offset)
 
+        indices, coefficients = self._coalesce()
+        num_shown = min(indices.size, _MAX_LINEAR_EXPRESSION_REPR_TERMS)
         result = []
-        for index, coeff in zip(self.variable_indices, self.coefficients):
-            if len(result) >= _MAX_LINEAR_EXPRESSION_REPR_TERMS:
-                result.append(" + ...")
-                break
+        # Only the displayed terms are converted to python objects.
+        for index, coeff in zip(
+            indices[:num_shown].tolist(), coefficients[:num_shown].tolist()
+        ):
             var_name = Variable(self._helper, index, None, None, None).name
             if not result and mbn.is_one(coeff):
                 result.append(var_name)
@@ -1811,6 +1959,8 @@ class _LinearExpression(LinearExpr):
                 result.append(f" + {coeff} * {var_name}")
             elif coeff < 0.0:
                 result.append(f" - {-coeff} * {var_name}")
+        if indices.size > num_shown:
+            result.append(" + ...")
 
         if not result:
             return f"{self.constant}"
@@ -1825,8 +1975,15 @@ def _sum_as_flat_linear_expression(
     to_process: List[Tuple[LinearExprT, float]], offset: float = 0.0
 ) -> _LinearExpression:
     """Creates a _LinearExpression as the sum of terms."""
-    indices = []
-    coeffs = []
+    # The stack visits terms right to left. Consecutive single variables are
+    # collected as scalars and converted to one array per run, flat expressions
+    # contribute their arrays directly, and the chunks are put back in source
+    # order at the end. Sums written in increasing variable order thus stay
+    # sorted.
+    var_indices: List[int] = []
+    var_coeffs: List[float] = []
+    indices: List[npt.NDArray[np.int32]] = []
+    coeffs: List[npt.NDArray[np.double]] = []
     helper = None
     while to_process:  # Flatten AST of LinearTypes.
         expr, coeff = to_process.pop()
@@ -1834,8 +1991,8 @@ def _sum_as_flat_linear_expression(
             to_process.append((expr._left, coeff))
             to_process.append((expr._right, coeff))
         elif isinstance(expr, Variable):
-            indices.append([expr.index])
-            coeffs.append([coeff])
+            var_indices.append(expr.index)
+            var_coeffs.append(coeff)
             if helper is None:
                 helper = expr.helper
         elif mbn.is_a_number(expr):
@@ -1845,8 +2002,9 @@ def _sum_as_flat_linear_expression(
         elif isinstance(expr, _LinearExpression):
             offset += coeff * expr._offset
             if expr._helper is not None:
-                indices.append(expr.variable_indices)
-                coeffs.append(np.multiply(expr.coefficients, coeff))
+                _flush_variable_terms(var_indices, var_coeffs, indices, coeffs)
+                indices.append(expr._variable_indices)
+                coeffs.append(np.multiply(expr._coefficients, coeff))
                 if helper is None:
                     helper = expr._helper
         else:
@@ -1855,13 +2013,16 @@ def _sum_as_flat_linear_expression(
             )
 
     if helper is not None:
-        all_indices: npt.NDArray[np.int32] = np.concatenate(indices, axis=0)
-        all_coeffs: npt.NDArray[np.double] = np.concatenate(coeffs, axis=0)
-        sorted_indices, sorted_coefficients = helper.sort_and_regroup_terms(
-            all_indices, all_coeffs
-        )
-        return _LinearExpression(sorted_indices, sorted_coefficients, offset, helper)
+        _flush_variable_terms(var_indices, var_coeffs, indices, coeffs)
+        all_indices: npt.NDArray[np.int32] = np.concatenate(
+            indices[::-1], axis=0
+        ).astype(np.int32, copy=False)
+        all_coeffs: npt.NDArray[np.double] = np.concatenate(
+            coeffs[::-1], axis=0
+        ).astype(np.double, copy=False)
+        return _LinearExpression(all_indices, all_coeffs, offset, helper)
     else:
+        assert not var_indices
         assert not indices
         assert not coeffs
         return _LinearExpression(
@@ -1872,6 +2033,98 @@ def _sum_as_flat_linear_expression(
         )
 
 
+def _flush_variable_terms(
+    var_indices: List[int],
+    var_coeffs: List[float],
+    indices: List[npt.NDArray[np.int32]],
+    coeffs: List[npt.NDArray[np.double]],
+) -> None:
+    """Moves the pending single-variable terms to `indices` and `coeffs`.
+
+    The pending terms were visited right to left, so they are reversed to get
+    back their source order.
+
+    Args:
+      var_indices: The indices of the pending variables. Cleared on return.
+      var_coeffs: The coefficients of the pending variables. Cleared on return.
+      indices: The list of index arrays to append to.
+      coeffs: The list of coefficient arrays to append to.
+    """
+    if not var_indices:
+        return
+    indices.append(np.array(var_indices[::-1], dtype=np.int32))
+    coeffs.append(np.array(var_coeffs[::-1], dtype=np.double))
+    var_indices.clear()
+    var_coeffs.clear()
+
+
+def _variables_as_flat_linear_expression(
+    variables: Sequence[Variable], coefficients: Sequence[NumberT], offset: float
+) -> _LinearExpression:
+    """Creates a _LinearExpression from variables and their coefficients."""
+    indices = np.fromiter(
+        (var.index for var in variables), dtype=np.int32, count=len(variables)
+    )
+    return _LinearExpression(
+        indices,
+        np.array(coefficients, dtype=np.double),
+        offset,
+        next(iter(variables)).helper,
+    )
+
+
+# Below this number of terms, merging them in a dict is faster than np.unique.
+_MAX_TERMS_FOR_DICT_COALESCING = 8
+
+
+def _coalesce_terms(
+    indices: npt.NDArray[np.int32], coefficients: npt.NDArray[np.double]
+) -> Tuple[npt.NDArray[np.int32], npt.NDArray[np.double]]:
+    """Sorts terms by variable index, merges duplicates and removes zero terms.
+
+    Duplicates are summed in the same order as in the C++ helper, so the merged
+    coefficients are exactly the ones stored in the model.
+    """
+    if not indices.size:
+        return indices, coefficients
+    if indices.size <= _MAX_TERMS_FOR_DICT_COALESCING:
+        grouped: Dict[int, List[float]] = {}
+        for index, coeff in zip(indices.tolist(), coefficients.tolist()):
+            grouped.setdefault(index, []).append(coeff)
+        terms = [
+            (index, _sum_as_helper(coeffs)) for index, coeffs in sorted(grouped.items())
+        ]
+        terms = [(index, coeff) for index, coeff in terms if coeff]
+        return (
+            np.array([index for index, _ in terms], dtype=np.int32),
+            np.array([coeff for _, coeff in terms], dtype=np.double),
+        )
+    if np.any(indices[1:] < indices[:-1]):
+        order = np.argsort(indices, kind="stable")
+        indices = indices[order]
+        coefficients = coefficients[order]
+    # Sorted terms (e.g. sums over a variable series) are merged in O(n): only
+    # the runs of equal indices need to be summed.
+    run_starts = np.flatnonzero(np.diff(indices, prepend=-1))
+    run_ends = np.append(run_starts[1:], indices.size)
+    unique_indices = indices[run_starts]
+    merged_coefficients = coefficients[run_starts]
+    for run in np.flatnonzero(run_ends - run_starts > 1).tolist():
+        merged_coefficients[run] = _sum_as_helper(
+            coefficients[run_starts[run] : run_ends[run]].tolist()
+        )
+    non_zeros = merged_coefficients != 0.0
+    return unique_indices[non_zeros], merged_coefficients[non_zeros]
+
+
+def _sum_as_helper(coefficients: List[float]) -> float:
+    """Sums coefficients by increasing absolute value, as SortedGroupedTerms."""
+    total = 0.0
+    for coeff in sorted(coefficients, key=lambda c: (abs(c), c)):
+        total += coeff
+    return total
+
+
 def _as_flat_linear_expression(base_expr: LinearExprT) -> _LinearExpression:
     """Converts floats, ints and Linear objects to a LinearExpression."""
     if isinstance(base_expr, _LinearExpression):
@@ -1938,6 +2191,53 @@ def _attribute_series(
     )
 
 
+def _index_array(values: _IndexOrSeries) -> npt.NDArray[np.int32]:
+    """Returns the indices of `values` (variables or constraints) as an array."""
+    return np.fromiter((v.index for v in values), dtype=np.int32, count=len(values))
+
+
+def _indexed_series(
+    *,
+    func: Callable[[npt.NDArray[np.int32]], npt.NDArray[np.double]],
+    values: _IndexOrSeries,
+) -> pd.Series:
+    """Returns the attributes of `values`, read with a single call to `func`.
+
+    Args:
+      func: The function returning the attribute of each index in its input.
+        It raises an IndexError for indices that are not in the model.
+      values: The variables (or constraints) to read the attribute of.
+
+    Returns:
+      pd.Series: The attribute values.
+    """
+    return pd.Series(data=func(_index_array(values)), index=_get_index(values))
+
+
+def _gathered_series(
+    *,
+    all_values: npt.NDArray[np.double],
+    values: _IndexOrSeries,
+) -> pd.Series:
+    """Returns the entries of `all_values` at the indices of `values`.
+
+    This is used for solution values: indices past the end of `all_values` get
+    0.0, as the scalar accessors of the solve helper do.
+
+    Args:
+      all_values: The values of all variables (or constraints) in the solution.
+      values: The variables (or constraints) to select.
+
+    Returns:
+      pd.Series: The selected values.
+    """
+    indices = np.fromiter((v.index for v in values), dtype=np.int64, count=len(values))
+    in_range = indices < all_values.size
+    data = np.zeros(len(indices), dtype=np.double)
+    data[in_range] = all_values[indices[in_range]]
+    return pd.Series(data=data, index=_get_index(values))
+
+
 def _convert_to_series_and_validate_index(
     value_or_series: Union[bool, NumberT, pd.Series], index: pd.Index
 ) -> pd.Series:
@@ -1966,6 +2266,36 @@ def _convert_to_series_and_validate_index(
     return result
 
 
+def _convert_to_array_and_validate_index(
+    value_or_series: Union[bool, NumberT, pd.Series],
+    index: pd.Index,
+    dtype: npt.DTypeLike,
+) -> npt.NDArray:
+    """Returns a contiguous array with one value per element of the given index.
+
+    Scalars are broadcast directly into the array, without building a pd.Series.
+
+    Args:
+      value_or_series: the values to be converted (if applicable).
+      index: the index the values must be aligned with.
+      dtype: the dtype of the resulting array.
+
+    Returns:
+      np.ndarray: The values, in the order of the index.
+
+    Raises:
+      TypeError: If the type of `value_or_series` is not recognized.
+      ValueError: If the index does not match.
+    """
+    if mbn.is_a_number(value_or_series) or isinstance(value_or_series, bool):
+        return np.full(len(index), value_or_series, dtype=dtype)
+    # to_numpy() may return a strided view (e.g. of a sliced series).
+    return np.ascontiguousarray(
+        _convert_to_series_and_validate_index(value_or_series, index).to_numpy(),
+        dtype=dtype,
+    )
+
+
 def _convert_to_var_series_and_validate_index(
     var_or_series: Union["Variable", pd.Series], index: pd.Index
 ) -> pd.Series:
@@ -31,6 +31,7 @@
 #include "absl/log/check.h"
 #include "absl/strings/str_cat.h"
 #include "absl/strings/string_view.h"
+#include "absl/types/span.h"
 #include "ortools/base/logging.h"
 #include "ortools/linear_solver/linear_solver.pb.h"
 #include "ortools/linear_solver/model_exporter.h"
@@ -55,6 +56,12 @@ using ::operations_research::SolveStatus;
 namespace py = pybind11;
 using ::py::arg;
 
+// Arrays that are read through raw pointers or absl::Span. Strided numpy views
+// are copied into a contiguous buffer when they are passed in.
+using IntArray = py::array_t<int, py::array::c_style | py::array::forcecast>;
+using DoubleArray =
+    py::array_t<double, py::array::c_style | py::array::forcecast>;
+
 const MPModelProto& ToMPModelProto(ModelBuilderHelper* helper) {
   return helper->model();
 }
@@ -120,6 +127,75 @@ void BuildModelFromSparseData(
   }
 }
 
+// Appends one linear constraint per row of the constraint matrix in a single
+// pass. Columns refer to existing variable indices of the model.
+void AddLinearConstraintsFromSparseData(
+    const Eigen::Ref<const VectorXd>& constraint_lower_bounds,
+    const Eigen::Ref<const VectorXd>& constraint_upper_bounds,
+    const SparseMatrix<double, Eigen::RowMajor>& constraint_matrix,
+    MPModelProto* model_proto) {
+  const int num_constraints = constraint_lower_bounds.size();
+
+  if (constraint_upper_bounds.size() != num_constraints) {
+    throw std::invalid_argument(absl::StrCat(
+        "Invalid size ", constraint_upper_bounds.size(),
+        " for constraint_upper_bounds. Expected: ", num_constraints));
+  }
+  if (constraint_matrix.rows() != num_constraints) {
+    throw std::invalid_argument(
+        absl::StrCat("Invalid number of rows ", constraint_matrix.rows(),
+                     " in constraint_matrix. Expected: ", num_constraints));
+  }
+  if (constraint_matrix.cols() > model_proto->variable_size()) {
+    throw std::invalid_argument(absl::StrCat(
+        "Invalid number of columns ", constraint_matrix.cols(),
+        " in constraint_matrix. Expected at most: ",
+        model_proto->variable_size()));
+  }
+
+  model_proto->mutable_constraint()->Reserve(model_proto->constraint_size() +
+                                             num_constraints);
+  for (int row = 0; row < num_constraints; ++row) {
+    MPConstraintProto* constraint = model_proto->add_constraint();
+    constraint->set_lower_bound(constraint_lower_bounds[row]);
+    constraint->set_upper_bound(constraint_upper_bounds[row]);
+    const int row_size = constraint_matrix.outerIndexPtr()[row + 1] -
+                         constraint_matrix.outerIndexPtr()[row];
+    constraint->mutable_var_index()->Reserve(row_size);
+    constraint->mutable_coefficient()->Reserve(row_size);
+    for (SparseMatrix<double, Eigen::RowMajor>::InnerIterator it(
+             constraint_matrix, row);
+         it; ++it) {
+      if (it.value() == 0.0) continue;
+      constraint->add_coefficient(it.value());
+      constraint->add_var_index(it.col());
+    }
+  }
+}
+
+// Returns `index` if it is in [0, size), throws std::out_of_range (IndexError
+// in python) otherwise.
+int CheckedIndex(int index, int size) {
+  if (index < 0 || index >= size) {
+    throw std::out_of_range(
+        absl::StrCat("Index ", index, " is out of range [0, ", size, ")"));
+  }
+  return index;
+}
+
+// Returns `get(protos[index])` for each index in `indices`, throws
+// std::out_of_range (IndexError in python) if an index is invalid.
+template <typename Proto, typename Getter>
+Eigen::VectorXd GatherAttribute(
+    const google::protobuf::RepeatedPtrField<Proto>& protos,
+    absl::Span<const int> indices, Getter get) {
+  Eigen::VectorXd vec(indices.size());
+  for (int i = 0; i < indices.size(); ++i) {
+    vec[i] = get(protos[CheckedIndex(indices[i], protos.size())]);
+  }
+  return vec;
+}
+
 std::vector<std::pair<int, double>> SortedGroupedTerms(
     absl::Span<const int> indices, absl::Span<const double> coefficients) {
   CHECK_EQ(indices.size(), coefficients.size());
@@ -212,6 +288,20 @@ PYBIND11_MODULE(model_builder_helper, m) {
           arg("variable_lower_bound"), arg("variable_upper_bound"),
           arg("objective_coefficients"), arg("constraint_lower_bounds"),
           arg("constraint_upper_bounds"), arg("constraint_matrix"))
+      .def(
+          "add_linear_constraints_from_sparse_data",
+          [](ModelBuilderHelper* helper,
+             const Eigen::Ref<const VectorXd>& constraint_lower_bounds,
+             const Eigen::Ref<const VectorXd>& constraint_upper_bounds,
+             const SparseMatrix<double, Eigen::RowMajor>& constraint_matrix) {
+            const int first_index = helper->model().constraint_size();
+            AddLinearConstraintsFromSparseData(
+                constraint_lower_bounds, constraint_upper_bounds,
+                constraint_matrix, helper->mutable_model());
+            return first_index;
+          },
+          arg("constraint_lower_bounds"), arg("constraint_upper_bounds"),
+          arg("constraint_matrix"))
       .def("add_var", &ModelBuilderHelper::AddVar)
       .def("add_var_array",
            [](ModelBuilderHelper* helper, std::vector<size_t> shape, double lb,
@@ -224,6 +314,9 @@ PYBIND11_MODULE(model_builder_helper, m) {
              py::buffer_info info = result.request();
              result.resize(shape);
              auto ptr = static_cast<int*>(info.ptr);
+             // Grow the variable list once instead of once per variable.
+             helper->mutable_model()->mutable_variable()->Reserve(
+                 helper->model().variable_size() + size);
              for (int i = 0; i < size; ++i) {
                const int index = helper->AddVar();
                ptr[i] = index;
@@ -237,8 +330,9 @@ PYBIND11_MODULE(model_builder_helper, m) {
              return result;
            })
       .def("add_var_array_with_bounds",
-           [](ModelBuilderHelper* helper, py::array_t<double> lbs,
-              py::array_t<double> ubs, py::array_t<bool> are_integral,
+           [](ModelBuilderHelper* helper, DoubleArray lbs, DoubleArray ubs,
+              py::array_t<bool, py::array::c_style | py::array::forcecast>
+                  are_integral,
               absl::string_view name_prefix) {
              py::buffer_info buf_lbs = lbs.request();
              py::buffer_info buf_ubs = ubs.request();
@@ -259,6 +353,9 @@ PYBIND11_MODULE(model_builder_helper, m) {
              result.resize(shape);
              py::buffer_info result_info = result.request();
              auto ptr = static_cast<int*>(result_info.ptr);
+             // Grow the variable list once instead of once per variable.
+             helper->mutable_model()->mutable_variable()->Reserve(
+                 helper->model().variable_size() + size);
              for (int i = 0; i < size; ++i) {
                const int index = helper->AddVar();
                ptr[i] = index;
@@ -275,14 +372,48 @@ PYBIND11_MODULE(model_builder_helper, m) {
            arg("var_index"), arg("lb"))
       .def("set_var_upper_bound", &ModelBuilderHelper::SetVarUpperBound,
            arg("var_index"), arg("ub"))
+      .def("set_var_lower_bounds",
+           [](ModelBuilderHelper* helper, IntArray var_indices,
+              DoubleArray lbs) {
+             if (var_indices.size() != lbs.size()) {
+               throw std::invalid_argument("Input sizes must match");
+             }
+             const absl::Span<const int> indices = var_indices;
+             const absl::Span<const double> bounds = lbs;
+             // Validates all indices before modifying the model.
+             for (const int index : indices) {
+               CheckedIndex(index, helper->num_variables());
+             }
+             for (int i = 0; i < indices.size(); ++i) {
+               helper->SetVarLowerBound(indices[i], bounds[i]);
+             }
+           },
+           arg("var_indices"), arg("lbs"))
+      .def("set_var_upper_bounds",
+           [](ModelBuilderHelper* helper, IntArray var_indices,
+              DoubleArray ubs) {
+             if (var_indices.size() != ubs.size()) {
+               throw std::invalid_argument("Input sizes must match");
+             }
+             const absl::Span<const int> indices = var_indices;
+             const absl::Span<const double> bounds = ubs;
+             // Validates all indices before modifying the model.
+             for (const int index : indices) {
+               CheckedIndex(index, helper->num_variables());
+             }
+             for (int i = 0; i < indices.size(); ++i) {
+               helper->SetVarUpperBound(indices[i], bounds[i]);
+             }
+           },
+           arg("var_indices"), arg("ubs"))
       .def("set_var_integrality", &ModelBuilderHelper::SetVarIntegrality,
            arg("var_index"), arg("is_integer"))
       .def("set_var_objective_coefficient",
            &ModelBuilderHelper::SetVarObjectiveCoefficient, arg("var_index"),
            arg("coeff"))
       .def("set_objective_coefficients",
-           [](ModelBuilderHelper* helper, const std::vector<int>& indices,
-              const std::vector<double>& coefficients) {
+           [](ModelBuilderHelper* helper, IntArray indices,
+              DoubleArray coefficients) {
              for (const auto& [i, c] :
                   SortedGroupedTerms(indices, coefficients)) {
                helper->SetVarObjectiveCoefficient(i, c);
@@ -294,6 +425,22 @@ PYBIND11_MODULE(model_builder_helper, m) {
            arg("var_index"))
       .def("var_upper_bound", &ModelBuilderHelper::VarUpperBound,
            arg("var_index"))
+      .def("var_lower_bounds",
+           [](const ModelBuilderHelper& helper, IntArray var_indices) {
+             return GatherAttribute(helper.model().variable(), var_indices,
+                                    [](const MPVariableProto& var) {
+                                      return var.lower_bound();
+                                    });
+           },
+           arg("var_indices"))
+      .def("var_upper_bounds",
+           [](const ModelBuilderHelper& helper, IntArray var_indices) {
+             return GatherAttribute(helper.model().variable(), var_indices,
+                                    [](const MPVariableProto& var) {
+                                      return var.upper_bound();
+                                    });
+           },
+           arg("var_indices"))
       .def("var_is_integral", &ModelBuilderHelper::VarIsIntegral,
            arg("var_index"))
       .def("var_objective_coefficient",
@@ -309,11 +456,18 @@ PYBIND11_MODULE(model_builder_helper, m) {
       .def("add_term_to_constraint", &ModelBuilderHelper::AddConstraintTerm,
            arg("ct_index"), arg("var_index"), arg("coeff"))
       .def("add_terms_to_constraint",
-           [](ModelBuilderHelper* helper, int ct_index,
-              const std::vector<int>& indices,
-              const std::vector<double>& coefficients) {
-             for (const auto& [i, c] :
-                  SortedGroupedTerms(indices, coefficients)) {
+           [](ModelBuilderHelper* helper, int ct_index, IntArray indices,
+              DoubleArray coefficients) {
+             const std::vector<std::pair<int, double>> terms =
+                 SortedGroupedTerms(indices, coefficients);
+             // Grow the repeated fields once instead of once per term.
+             MPConstraintProto* ct_proto =
+                 helper->mutable_model()->mutable_constraint(ct_index);
+             ct_proto->mutable_var_index()->Reserve(ct_proto->var_index_size() +
+                                                    terms.size());
+             ct_proto->mutable_coefficient()->Reserve(
+                 ct_proto->coefficient_size() + terms.size());
+             for (const auto& [i, c] : terms) {
                helper->AddConstraintTerm(ct_index, i, c);
              }
            })
@@ -331,6 +485,22 @@ PYBIND11_MODULE(model_builder_helper, m) {
            arg("ct_index"))
       .def("constraint_name", &ModelBuilderHelper::ConstraintName,
            arg("ct_index"))
+      .def("constraint_lower_bounds",
+           [](const ModelBuilderHelper& helper, IntArray ct_indices) {
+             return GatherAttribute(helper.model().constraint(), ct_indices,
+                                    [](const MPConstraintProto& ct) {
+                                      return ct.lower_bound();
+                                    });
+           },
+           arg("ct_indices"))
+      .def("constraint_upper_bounds",
+           [](const ModelBuilderHelper& helper, IntArray ct_indices) {
+             return GatherAttribute(helper.model().constraint(), ct_indices,
+                                    [](const MPConstraintProto& ct) {
+                                      return ct.upper_bound();
+                                    });
+           },
+           arg("ct_indices"))
       .def("constraint_var_indices", &ModelBuilderHelper::ConstraintVarIndices,
            arg("ct_index"))
       .def("constraint_coefficients",
@@ -349,9 +519,8 @@ PYBIND11_MODULE(model_builder_helper, m) {
            &ModelBuilderHelper::AddEnforcedConstraintTerm, arg("ct_index"),
            arg("var_index"), arg("coeff"))
       .def("add_terms_to_enforced_constraint",
-           [](ModelBuilderHelper* helper, int ct_index,
-              const std::vector<int>& indices,
-              const std::vector<double>& coefficients) {
+           [](ModelBuilderHelper* helper, int ct_index, IntArray indices,
+              DoubleArray coefficients) {
              for (const auto& [i, c] :
                   SortedGroupedTerms(indices, coefficients)) {
                helper->AddEnforcedConstraintTerm(ct_index, i, c);
@@ -400,8 +569,8 @@ PYBIND11_MODULE(model_builder_helper, m) {
       .def("add_hint", &ModelBuilderHelper::AddHint, arg("var_index"),
            arg("var_value"))
       .def("sort_and_regroup_terms",
-           [](ModelBuilderHelper* helper, py::array_t<int> indices,
-              py::array_t<double> coefficients) {
+           [](ModelBuilderHelper* helper, IntArray indices,
+              DoubleArray coefficients) {
              const std::vector<std::pair<int, double>> terms =
                  SortedGroupedTerms(indices, coefficients);
              std::vector<int> sorted_indices;
@@ -497,16 +666,22 @@ PYBIND11_MODULE(model_builder_helper, m) {
              return vec;
            })
       .def("expression_value",
-           [](const ModelSolverHelper& helper, const std::vector<int>& indices,
-              const std::vector<double>& coefficients, double constant) {
+           [](const ModelSolverHelper& helper, IntArray indices,
+              DoubleArray coefficients, double constant) {
              if (!helper.has_response()) {
                throw std::logic_error(
                    "Accessing a solution value when none has been found.");
              }
+             if (indices.size() != coefficients.size()) {
+               throw std::invalid_argument(
+                   "indices and coefficients must have the same size");
+             }
              const MPSolutionResponse& response = helper.response();
+             const int* index_data = indices.data();
+             const double* coefficient_data = coefficients.data();
              for (int i = 0; i < indices.size(); ++i) {
-               constant +=
-                   response.variable_value(indices[i]) * coefficients[i];
+               constant += response.variable_value(index_data[i]) *
+                           coefficient_data[i];
              }
              return constant;
            })
@@ -101,6 +101,22 @@ class PywrapModelBuilderHelperTest(absltest.TestCase):
         self.assertEqual(1, len(values))
         self.assertAlmostEqual(1.0, values[0])
 
+    def test_expression_value_from_strided_arrays(self):
+        model = model_builder_helper.ModelBuilderHelper()
+        for i in range(4):
+            model.add_var()
+            model.set_var_lower_bound(i, i + 1.0)
+            model.set_var_upper_bound(i, i + 1.0)
+
+        solver = model_builder_helper.ModelSolverHelper("glop")
+        solver.solve(model)
+        indices = np.arange(4, dtype=np.int32)
+        coefficients = np.array([1.0, 10.0, 100.0, 1000.0])
+        # 1.0 * 1.0 + 100.0 * 3.0 + 0.5
+        self.assertAlmostEqual(
+            301.5, solver.expression_value(indices[::2], coefficients[::2], 0.5)
+        )
+
     def test_solve_with_pdlp(self):
         model = linear_solver_pb2.MPModelProto()
         model.variable.append(
@@ -184,6 +200,118 @@ class PywrapModelBuilderHelperTest(absltest.TestCase):
         self.assertEqual((10,), var_array.shape)
         self.assertEqual(model.var_name(var_array[3]), "var_3")
 
+    def test_add_linear_constraints_from_sparse_data(self):
+        model = model_builder_helper.ModelBuilderHelper()
+        for _ in range(3):
+            model.add_var()
+        model.add_linear_constraint()
+        constraint_matrix = sparse.csr_matrix(
+            np.array([[1.0, 0.0, 2.0], [0.0, 3.0, 0.0]])
+        )
+        first_index = model.add_linear_constraints_from_sparse_data(
+            np.array([-1.0, -np.inf]), np.array([1.0, 4.0]), constraint_matrix
+        )
+        self.assertEqual(1, first_index)
+        self.assertEqual(3, model.num_constraints())
+        self.assertEqual(-1.0, model.constraint_lower_bound(1))
+        self.assertEqual(1.0, model.constraint_upper_bound(1))
+        self.assertEqual([0, 2], model.constraint_var_indices(1))
+        self.assertEqual([1.0, 2.0], model.constraint_coefficients(1))
+        self.assertEqual(-np.inf, model.constraint_lower_bound(2))
+        self.assertEqual(4.0, model.constraint_upper_bound(2))
+        self.assertEqual([1], model.constraint_var_indices(2))
+        self.assertEqual([3.0], model.constraint_coefficients(2))
+
+        with self.assertRaises(ValueError):
+            model.add_linear_constraints_from_sparse_data(
+                np.array([0.0]), np.array([1.0]), sparse.csr_matrix(np.ones((1, 4)))
+            )
+
+    def test_get_constraint_bounds_from_strided_indices(self):
+        model = model_builder_helper.ModelBuilderHelper()
+        for i in range(3):
+            model.add_linear_constraint()
+            model.set_constraint_lower_bound(i, -float(i))
+            model.set_constraint_upper_bound(i, float(i))
+        indices = np.array([2, -1, 0, -1, 1, -1], dtype=np.int32)[::2]
+        self.assertSequenceEqual(
+            [-2.0, 0.0, -1.0], list(model.constraint_lower_bounds(indices))
+        )
+        self.assertSequenceEqual(
+            [2.0, 0.0, 1.0], list(model.constraint_upper_bounds(indices))
+        )
+        with self.assertRaises(IndexError):
+            model.constraint_upper_bounds(np.array([3], dtype=np.int32))
+
+    def test_set_var_bounds(self):
+        model = model_builder_helper.ModelBuilderHelper()
+        for _ in range(3):
+            model.add_var()
+        model.set_var_lower_bounds(
+            np.array([2, 0], dtype=np.int32), np.array([-2.0, 3.0])
+        )
+        model.set_var_upper_bounds(np.array([1], dtype=np.int32), np.array([5.0]))
+        self.assertEqual(3.0, model.var_lower_bound(0))
+        self.assertEqual(-np.inf, model.var_lower_bound(1))
+        self.assertEqual(-2.0, model.var_lower_bound(2))
+        self.assertEqual(np.inf, model.var_upper_bound(0))
+        self.assertEqual(5.0, model.var_upper_bound(1))
+        indices = np.array([2, 0, 1], dtype=np.int32)
+        self.assertSequenceEqual(
+            [-2.0, 3.0, -np.inf], list(model.var_lower_bounds(indices))
+        )
+        self.assertSequenceEqual(
+            [np.inf, np.inf, 5.0], list(model.var_upper_bounds(indices))
+        )
+        with self.assertRaises(IndexError):
+            model.var_lower_bounds(np.array([3], dtype=np.int32))
+
+        with self.assertRaises(ValueError):
+            model.set_var_lower_bounds(
+                np.array([0, 1], dtype=np.int32), np.array([1.0])
+            )
+
+        with self.assertRaises(IndexError):
+            model.set_var_lower_bounds(
+                np.array([1, 3], dtype=np.int32), np.array([7.0, 7.0])
+            )
+        # Nothing is modified when an index is invalid.
+        self.assertEqual(-np.inf, model.var_lower_bound(1))
+
+        with self.assertRaises(IndexError):
+            model.set_var_upper_bounds(np.array([-1], dtype=np.int32), np.array([1.0]))
+
+    def test_set_var_bounds_from_strided_arrays(self):
+        model = model_builder_helper.ModelBuilderHelper()
+        for _ in range(3):
+            model.add_var()
+        indices = np.array([2, -1, 0, -1, 1, -1], dtype=np.int32)[::2]
+        lbs = np.array([[-2.0, 0.0], [3.0, 0.0], [4.0, 0.0]])[:, 0]
+        ubs = np.array([6.0, 0.0, 7.0, 0.0, 8.0, 0.0])[::2]
+        model.set_var_lower_bounds(indices, lbs)
+        model.set_var_upper_bounds(indices, ubs)
+        self.assertSequenceEqual(
+            [3.0, 4.0, -2.0], list(model.var_lower_bounds(np.arange(3, dtype=np.int32)))
+        )
+        self.assertSequenceEqual(
+            [7.0, 8.0, 6.0], list(model.var_upper_bounds(np.arange(3, dtype=np.int32)))
+        )
+
+    def test_add_terms_from_strided_arrays(self):
+        model = model_builder_helper.ModelBuilderHelper()
+        for _ in range(6):
+            model.add_var()
+        ct_index = model.add_linear_constraint()
+        indices = np.arange(6, dtype=np.int32)
+        coefficients = np.arange(1.0, 7.0)
+        model.add_terms_to_constraint(ct_index, indices[::2], coefficients[::2])
+        self.assertEqual([0, 2, 4], model.constraint_var_indices(ct_index))
+        self.assertEqual([1.0, 3.0, 5.0], model.constraint_coefficients(ct_index))
+        model.set_objective_coefficients(indices[1::2], coefficients[1::2])
+        self.assertEqual(0.0, model.var_objective_coefficient(0))
+        self.assertEqual(2.0, model.var_objective_coefficient(1))
+        self.assertEqual(6.0, model.var_objective_coefficient(5))
+
     def test_set_coefficient(self):
         var_lb = np.array([-1.0, -2.0])
         var_ub = np.array([np.inf, np.inf])
@@ -22,6 +22,7 @@ from absl.testing import parameterized
 import numpy as np
 import numpy.testing as np_testing
 import pandas as pd
+from scipy import sparse
 
 import os
 
@@ -93,53 +94,86 @@ class ModelBuilderTest(absltest.TestCase):
         self.assertEqual(mb.SolveStatus.OPTIMAL, solver.solve(model))
 
         # The problem has an optimal solution.
-        self.assertAlmostEqual(
-            733.333333 + model.objective_offset,
-            solver.objective_value,
-            places=self.NUM_PLACES,
-        )
-        self.assertAlmostEqual(
-            solver.value(10.0 * x1 + 6 * x2 + 4.0 * x3 - 5.5),
-            solver.objective_value,
-            places=self.NUM_PLACES,
-        )
-        self.assertAlmostEqual(33.333333, solver.value(x1), places=self.NUM_PLACES)
-        self.assertAlmostEqual(66.666667, solver.value(x2), places=self.NUM_PLACES)
-        self.assertAlmostEqual(0.0, solver.value(x3), places=self.NUM_PLACES)
-
+        variables = pd.Index([x1, x2, x3])
+        constraints = pd.Index([c0, c1, c2])
         dual_objective_value = (
-            solver.dual_value(c0) * c0.upper_bound
-            + solver.dual_value(c1) * c1.upper_bound
-            + solver.dual_value(c2) * c2.upper_bound
+            np.dot(
+                solver.dual_values(constraints),
+                model.get_linear_constraint_upper_bounds(constraints),
+            )
             + model.objective_offset
         )
-        self.assertAlmostEqual(
-            solver.objective_value, dual_objective_value, places=self.NUM_PLACES
-        )
-
-        # x1 and x2 are basic
-        self.assertAlmostEqual(0.0, solver.reduced_cost(x1), places=self.NUM_PLACES)
-        self.assertAlmostEqual(0.0, solver.reduced_cost(x2), places=self.NUM_PLACES)
         # x3 is non-basic
         x3_expected_reduced_cost = (
             4.0 - 1.0 * solver.dual_value(c0) - 5.0 * solver.dual_value(c1)
         )
-        self.assertAlmostEqual(
-            x3_expected_reduced_cost,
-            solver.reduced_cost(x3),
-            places=self.NUM_PLACES,
+        np_testing.assert_allclose(
+            [
+                solver.objective_value,
+                solver.value(10.0 * x1 + 6 * x2 + 4.0 * x3 - 5.5),
+                dual_objective_value,
+                *solver.values(variables),
+                *solver.reduced_costs(variables),
+                *[solver.activity(c) for c in constraints],
+            ],
+            [
+                733.333333 + model.objective_offset,
+                solver.objective_value,
+                solver.objective_value,
+                33.333333,
+                66.666667,
+                0.0,
+                # x1 and x2 are basic
+                0.0,
+                0.0,
+                x3_expected_reduced_cost,
+                100.0,
+                600.0,
+                200.0,
+            ],
+            rtol=0,
+            atol=0.5 * 10**-self.NUM_PLACES,
         )
 
-        self.assertAlmostEqual(100.0, solver.activity(c0), places=self.NUM_PLACES)
-        self.assertAlmostEqual(600.0, solver.activity(c1), places=self.NUM_PLACES)
-        self.assertAlmostEqual(200.0, solver.activity(c2), places=self.NUM_PLACES)
-
         self.assertIn("minimal_linear_example", model.export_to_lp_string(False))
         self.assertIn("minimal_linear_example", model.export_to_mps_string(False))
 
     def test_minimal_linear_example(self):
         self.run_minimal_linear_example("glop")
 
+    def test_add_linear_constraints_from_sparse_data(self):
+        model = mb.Model()
+        x1 = model.new_num_var(1.0, math.inf, "x1")
+        x2 = model.new_num_var(0.0, math.inf, "x2")
+        x3 = model.new_num_var(0.0, math.inf, "x3")
+        model.maximize(10.0 * x1 + 6 * x2 + 4.0 * x3 - 5.5)
+
+        constraints = model.add_linear_constraints_from_sparse_data(
+            sparse.csr_matrix([[1.0, 1.0, 1.0], [10.0, 4.0, 5.0], [2.0, 2.0, 6.0]]),
+            upper_bounds=[100.0, 600.0, 300.0],
+        )
+        self.assertLen(constraints, 3)
+        self.assertEqual(3, model.num_constraints)
+        self.assertEqual(-math.inf, constraints[0].lower_bound)
+        self.assertEqual(600.0, constraints[1].upper_bound)
+
+        solver = mb.Solver("glop")
+        self.assertEqual(mb.SolveStatus.OPTIMAL, solver.solve(model))
+        self.assertAlmostEqual(
+            733.333333 - 5.5, solver.objective_value, places=self.NUM_PLACES
+        )
+        self.assertAlmostEqual(
+            100.0, solver.activity(constraints[0]), places=self.NUM_PLACES
+        )
+        self.assertAlmostEqual(
+            200.0, solver.activity(constraints[2]), places=self.NUM_PLACES
+        )
+
+        with self.assertRaises(ValueError):
+            model.add_linear_constraints_from_sparse_data(
+                sparse.csr_matrix(np.ones((2, 3))), upper_bounds=[1.0, 2.0, 3.0]
+            )
+
     def test_import_from_mps_string(self):
         mps_data = """
 * Generated by MPModelProtoExporter
@@ -165,6 +199,11 @@ ENDATA
         self.assertTrue(model.import_from_mps_string(mps_data))
         self.assertEqual(model.name, "SupportedMaximizationProblem")
 
+        model = mb.Model()
+        self.assertTrue(model.import_from_mps_string(mps_data.encode()))
+        self.assertEqual(model.name, "SupportedMaximizationProblem")
+        self.assertEqual(1, model.num_variables)
+
     def test_import_from_mps_file(self):
         path = os.path.dirname(__file__)
         mps_path = f"{path}/../testdata/maximization.mps"
@@ -271,6 +310,7 @@ ENDATA
 
         e7 = mb.LinearExpr.term(x, 1.0, constant=0.0)
         self.assertEqual(x, e7)
+        self.assertIs(x, e7)
 
         e8 = mb.LinearExpr.term(2, 3, constant=4)
         self.assertEqual(e8, 10)
@@ -282,6 +322,16 @@ ENDATA
             str(mb._as_flat_linear_expression(e10)),
         )
 
+        e11 = mb.LinearExpr.term(e4, -2, constant=1)
+        np_testing.assert_array_equal(
+            np.array([0, 3], dtype=np.int32), e11.variable_indices
+        )
+        np_testing.assert_array_equal(
+            np.array([2, -2], dtype=np.double), e11.coefficients
+        )
+        self.assertEqual(e11.constant, -3.0)
+        self.assertEqual(e11.__str__(), "2.0 * x - 2.0 * t - 3.0")
+
     def test_variables(self):
         model = mb.Model()
         x = model.new_int_var(0.0, 4.0, "x")
@@ -377,6 +427,71 @@ ENDATA
         status = solver.solve(model)
         self.assertEqual(mb.SolveStatus.OPTIMAL, status)
 
+    def test_issue_3614_with_sparse_data(self):
+        total_number_of_choices = 5 + 1
+        total_unique_products = 3
+        num_standalone_features = 5
+        feature_bundle_incidence_matrix = sparse.coo_matrix(
+            ([1.0, 1.0], ([0, 1], [0, 0])), shape=(num_standalone_features, 1)
+        )
+        bundle_start_idx = num_standalone_features
+
+        # Model
+        model = mb.Model()
+        y = model.new_bool_var_series("y", pd.RangeIndex(total_number_of_choices))
+        v = model.new_bool_var_series(
+            "v",
+            pd.MultiIndex.from_product(
+                [range(total_unique_products), range(num_standalone_features)]
+            ),
+        )
+        y_indices = np.array([var.index for var in y])
+        v_indices = np.array([var.index for var in v])
+        num_rows = len(v)
+        feature = np.arange(num_rows) % num_standalone_features
+
+        # One row per v[j, i] - y[i] - incidence[i, k] * y[bundle + k] == 0.
+        bundle_rows = (
+            np.arange(total_unique_products)[:, np.newaxis] * num_standalone_features
+            + feature_bundle_incidence_matrix.row
+        ).ravel()
+        bundle_cols = np.tile(
+            y_indices[bundle_start_idx + feature_bundle_incidence_matrix.col],
+            total_unique_products,
+        )
+        bundle_data = np.tile(
+            -feature_bundle_incidence_matrix.data, total_unique_products
+        )
+        constraint_matrix = sparse.coo_matrix(
+            (
+                np.concatenate([np.ones(num_rows), -np.ones(num_rows), bundle_data]),
+                (
+                    np.concatenate(
+                        [np.arange(num_rows), np.arange(num_rows), bundle_rows]
+                    ),
+                    np.concatenate([v_indices, y_indices[feature], bundle_cols]),
+                ),
+            ),
+            shape=(num_rows, model.num_variables),
+        )
+        constraints = model.add_linear_constraints_from_sparse_data(
+            constraint_matrix, 0.0, 0.0
+        )
+        self.assertLen(constraints, num_rows)
+
+        solver = mb.Solver("sat")
+        status = solver.solve(model)
+        self.assertEqual(mb.SolveStatus.OPTIMAL, status)
+        y_values = solver.values(y).to_numpy()
+        np_testing.assert_array_equal(
+            solver.values(v).to_numpy(),
+            y_values[feature]
+            + np.tile(
+                feature_bundle_incidence_matrix.toarray()[:, 0], total_unique_products
+            )
+            * y_values[bundle_start_idx],
+        )
+
     def test_vareqvar(self):
         model = mb.Model()
         x = model.new_int_var(0.0, 4.0, "x")
@@ -433,6 +548,22 @@ class InternalHelperTest(absltest.TestCase):
         constraint = mb.LinearConstraint(helper, index)
         self.assertEqual(constraint.name, f"linear_constraint#{index}")
 
+    def test_merged_terms_match_the_helper(self):
+        model = mb.Model()
+        x = model.new_num_var_series("x", pd.Index(range(3)), 0.0, 1.0)
+        for expr in (
+            x[0] + 1e-16 * x[0] + 1e-16 * x[0],
+            mb.LinearExpr.weighted_sum(
+                [x[i % 3] for i in range(20)], [0.1 * (i % 7) for i in range(20)]
+            ),
+        ):
+            flat_expr = mb._as_flat_linear_expression(expr)
+            indices, coefficients = model.helper.sort_and_regroup_terms(
+                flat_expr._variable_indices, flat_expr._coefficients
+            )
+            self.assertSequenceEqual(indices, flat_expr.variable_indices)
+            self.assertSequenceEqual(coefficients, flat_expr.coefficients)
+
 
 class LinearBaseTest(parameterized.TestCase):
     def setUp(self):
@@ -534,6 +665,19 @@ class LinearBaseTest(parameterized.TestCase):
             expr=lambda x, y: mb.LinearExpr.sum([x.sum(), y.sum() + 5]),
             expected_repr="x[0] + x[1] + x[2] + y[0] + y[1] + ... + 5.0",
         ),
+        dict(
+            testcase_name="LinearExpr.sum(list(x))",
+            expr=lambda x, y: mb.LinearExpr.sum(list(x)),
+            expected_repr="x[0] + x[1] + x[2]",
+        ),
+        dict(
+            testcase_name="LinearExpr.weighted_sum(list(x), [1, 0, -2])",
+            # pylint: disable=g-long-lambda
+            expr=lambda x, y: mb.LinearExpr.weighted_sum(
+                list(x), [1, 0, -2], constant=3
+            ),
+            expected_repr="x[0] - 2.0 * x[2] + 3.0",
+        ),
         # Product
         dict(
             testcase_name="- x.sum()",
@@ -728,6 +872,13 @@ class BoundedLinearBaseTest(parameterized.TestCase):
         self.assertNotEqual(y[1], y[0])
         self.assertNotEqual(y[1], x[1])
 
+        self.assertIs(bool(x[0] == x[0]), True)
+        self.assertIs(bool(x[0] == x[1]), False)
+        self.assertTrue(x[0] != x[1])
+        self.assertFalse(x[0] != x[0])
+        self.assertIn(x[1], [x[0], x[1]])
+        self.assertNotIn(y[0], [x[0], x[1]])
+
 
 class BoundedLinearBaseErrorsTest(absltest.TestCase):
     def test_bounded_linear_expression_as_bool(self):
@@ -787,6 +938,24 @@ class ModelBuilderErrorsTest(absltest.TestCase):
                 name="x", index=pd.Index([0]), is_integral=pd.Series([False, True])
             )
 
+    def test_get_bounds_of_unknown_variables_and_constraints(self):
+        model = mb.Model()
+        x = model.new_num_var(0.0, 1.0, "x")
+        model.add_linear_constraint(x, 0.0, 1.0)
+        other = mb.Model()
+        other.new_num_var(0.0, 1.0, "x")
+        y = other.new_num_var(0.0, 1.0, "y")
+        other.add_linear_constraint(y, 0.0, 1.0)
+        c = other.add_linear_constraint(y, 0.0, 1.0)
+        with self.assertRaisesRegex(IndexError, r"out of range"):
+            model.get_variable_lower_bounds(pd.Index([y]))
+        with self.assertRaisesRegex(IndexError, r"out of range"):
+            model.get_variable_upper_bounds(pd.Index([y]))
+        with self.assertRaisesRegex(IndexError, r"out of range"):
+            model.get_linear_constraint_lower_bounds(pd.Index([c]))
+        with self.assertRaisesRegex(IndexError, r"out of range"):
+            model.get_linear_constraint_upper_bounds(pd.Index([c]))
+
     def test_add_linear_constraints_errors(self):
         with self.assertRaisesRegex(TypeError, r"Not supported"):
             model = mb.Model()
@@ -893,6 +1062,26 @@ class ModelBuilderVariablesTest(parameterized.TestCase):
         for i in index:
             self.assertEqual(repr(variables[i]), f"test_variable[{i}]")
 
+    def test_new_var_series_with_sliced_bounds(self):
+        bounds = pd.Series(np.arange(10.0))
+        lower_bounds = bounds.iloc[::2]
+        upper_bounds = bounds.iloc[::2] + 0.5
+        model = mb.Model()
+        x = model.new_var_series(
+            name="x",
+            index=lower_bounds.index,
+            lower_bounds=lower_bounds,
+            upper_bounds=upper_bounds,
+            is_integral=pd.Series([False, True] * 5).iloc[::2],
+        )
+        self.assertSequenceEqual(
+            [0.0, 2.0, 4.0, 6.0, 8.0], model.get_variable_lower_bounds(x).tolist()
+        )
+        self.assertSequenceEqual(
+            [0.5, 2.5, 4.5, 6.5, 8.5], model.get_variable_upper_bounds(x).tolist()
+        )
+        self.assertFalse(any(var.is_integral for var in x))
+
     @parameterized.product(
         index=_variable_indices, bounds=_bounds, is_integer=_is_integer
     )
@@ -975,6 +1164,39 @@ class ModelBuilderVariablesTest(parameterized.TestCase):
         upper_bounds = model.get_variable_upper_bounds(variables)
         self.assertSequenceAlmostEqual(upper_bounds.index, variables)
 
+    @parameterized.product(index=_variable_indices, bounds=_bounds)
+    def test_set_variable_bounds(self, index, bounds):
+        lower_bound, upper_bound = bounds(index)
+        model = mb.Model()
+        x = model.new_var_series(
+            name="x",
+            index=index,
+            lower_bounds=-1000.0,
+            upper_bounds=1000.0,
+        )
+        y = model.new_var_series(
+            name="y",
+            index=index,
+            lower_bounds=-1000.0,
+            upper_bounds=1000.0,
+        )
+        model.set_variable_lower_bounds(x, lower_bound)
+        model.set_variable_upper_bounds(x, upper_bound)
+        self.assertSequenceAlmostEqual(
+            model.get_variable_lower_bounds(x),
+            mb._convert_to_series_and_validate_index(lower_bound, index),
+        )
+        self.assertSequenceAlmostEqual(
+            model.get_variable_upper_bounds(x),
+            mb._convert_to_series_and_validate_index(upper_bound, index),
+        )
+        self.assertSequenceAlmostEqual(
+            model.get_variable_lower_bounds(y), [-1000.0] * len(index)
+        )
+        self.assertSequenceAlmostEqual(
+            model.get_variable_upper_bounds(y), [1000.0] * len(index)
+        )
+
 
 class ModelBuilderLinearConstraintsTest(parameterized.TestCase):
     constraint_test_cases = [
@@ -23,6 +23,7 @@
 
 #include "absl/log/check.h"
 #include "absl/strings/match.h"
+#include "absl/strings/string_view.h"
 #include "ortools/base/helpers.h"
 #include "ortools/base/options.h"
 #include "ortools/linear_solver/linear_solver.h"
@@ -68,11 +69,11 @@ bool ModelBuilderHelper::WriteModelToFile(const std::string& filename) {
 
 // See comment in the header file why we need to wrap absl::Status code with
 // code having simpler APIs.
-bool ModelBuilderHelper::ImportFromMpsString(const std::string& mps_string) {
+bool ModelBuilderHelper::ImportFromMpsString(absl::string_view mps_string) {
   absl::StatusOr<MPModelProto> model_or =
       operations_research::glop::MpsDataToMPModelProto(mps_string);
   if (!model_or.ok()) return false;
-  model_ = model_or.value();
+  model_ = *std::move(model_or);
   return true;
 }
 
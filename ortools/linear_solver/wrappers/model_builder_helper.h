@@ -21,6 +21,7 @@
 #include <string>
 #include <vector>
 
+#include "absl/strings/string_view.h"
 #include "ortools/linear_solver/linear_solver.pb.h"
 #include "ortools/linear_solver/model_exporter.h"
 #include "ortools/util/logging.h"
@@ -52,7 +53,7 @@ class ModelBuilderHelper {
                                    options = MPModelExportOptions());
   bool WriteModelToFile(const std::string& filename);
 
-  bool ImportFromMpsString(const std::string& mps_string);
+  bool ImportFromMpsString(absl::string_view mps_string);
   bool ImportFromMpsFile(const std::string& mps_file);
 #if defined(USE_LP_PARSER)
   bool ImportFromLpString(const std::string& lp_string);